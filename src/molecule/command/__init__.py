@@ -23,26 +23,60 @@
 # NOTE(retr0h): Importing into the ``molecule.command`` namespace, to prevent
 # collisions (e.g. ``list``).  The CLI usage may conflict with reserved words
 # or builtins.
+# Submodules are imported on first attribute access, so that running a single
+# subcommand does not load every other command module.
 from __future__ import annotations
 
-from molecule.command import (
-    base,  # noqa: F401
-    check,  # noqa: F401
-    cleanup,  # noqa: F401
-    converge,  # noqa: F401
-    create,  # noqa: F401
-    dependency,  # noqa: F401
-    destroy,  # noqa: F401
-    drivers,  # noqa: F401
-    idempotence,  # noqa: F401
-    list,  # noqa: A004, F401
-    login,  # noqa: F401
-    matrix,  # noqa: F401
-    prepare,  # noqa: F401
-    reset,  # noqa: F401
-    side_effect,  # noqa: F401
-    syntax,  # noqa: F401
-    test,  # noqa: F401
-    verify,  # noqa: F401
-)
+import importlib
+
+from typing import TYPE_CHECKING
+
+# Bound eagerly, as importing molecule.command.init.init would otherwise
+# rebind ``init`` to the molecule.command.init package.
 from molecule.command.init import init  # noqa: F401
+
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+
+_SUBMODULES = {
+    "base": "molecule.command.base",
+    "check": "molecule.command.check",
+    "cleanup": "molecule.command.cleanup",
+    "converge": "molecule.command.converge",
+    "create": "molecule.command.create",
+    "dependency": "molecule.command.dependency",
+    "destroy": "molecule.command.destroy",
+    "drivers": "molecule.command.drivers",
+    "idempotence": "molecule.command.idempotence",
+    "list": "molecule.command.list",
+    "login": "molecule.command.login",
+    "matrix": "molecule.command.matrix",
+    "prepare": "molecule.command.prepare",
+    "reset": "molecule.command.reset",
+    "side_effect": "molecule.command.side_effect",
+    "syntax": "molecule.command.syntax",
+    "test": "molecule.command.test",
+    "verify": "molecule.command.verify",
+}
+
+
+def __getattr__(name: str) -> ModuleType:
+    """Import a command submodule on first access.
+
+    Args:
+        name: Name of the attribute being accessed.
+
+    Returns:
+        The imported submodule.
+
+    Raises:
+        AttributeError: When name is not a command submodule.
+    """
+    if name not in _SUBMODULES:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    module = importlib.import_module(_SUBMODULES[name])
+    globals()[name] = module
+    return module
@@ -22,28 +22,21 @@
 from __future__ import annotations
 
 import abc
-import collections
-import contextlib
-import copy
 import importlib
 import logging
 import os
-import shutil
-import subprocess
 
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import click
-import wcmatch.pathlib
-import wcmatch.wcmatch
 
 from click_help_colors import HelpColorsCommand, HelpColorsGroup
-from wcmatch import glob
 
-from molecule import config, logger, text, util
+from molecule import api, config, logger, text, util
 from molecule.console import console, should_do_markup
 from molecule.exceptions import MoleculeError, ScenarioFailureError
-from molecule.scenarios import Scenarios
 from molecule.util import safe_dump
 
 
@@ -51,7 +44,10 @@ if TYPE_CHECKING:
     from collections.abc import Callable
     from typing import NoReturn
 
+    from click.shell_completion import CompletionItem
+
     from molecule.scenario import Scenario
+    from molecule.scenarios import Scenarios
     from molecule.types import CommandArgs, MoleculeArgs, ScenariosResults
 
     ClickCommand = Callable[[Callable[..., None]], click.Command]
@@ -61,6 +57,11 @@ LOG = logging.getLogger(__name__)
 MOLECULE_GLOB = os.environ.get("MOLECULE_GLOB", "molecule/*/molecule.yml")
 MOLECULE_DEFAULT_SCENARIO_NAME = "default"
 
+# Command classes resolved by execute_subcommand, keyed by subcommand name.
+_SUBCOMMAND_CACHE: dict[str, type[Base]] = {}
+# Characters which give a path special meaning to wcmatch.glob.
+_GLOB_MAGIC = frozenset("*?[]{}!@+|\\")
+
 
 class Base(abc.ABC):
     """An abstract base class used to define the command interface."""
@@ -123,18 +124,19 @@ def execute_cmdline_scenarios(
     """
     if excludes is None:
         excludes = []
+    exclude_set = frozenset(excludes)
 
     configs: list[config.Config] = []
     if scenario_names is None:
         configs = [
             config
             for config in get_configs(args, command_args, ansible_args, MOLECULE_GLOB)
-            if config.scenario.name not in excludes
+            if config.scenario.name not in exclude_set
         ]
     else:
         try:
             # filter out excludes
-            scenario_names = [name for name in scenario_names if name not in excludes]
+            scenario_names = [name for name in scenario_names if name not in exclude_set]
             for scenario_name in scenario_names:
                 glob_str = MOLECULE_GLOB.replace("*", scenario_name)
                 configs.extend(get_configs(args, command_args, ansible_args, glob_str))
@@ -173,18 +175,21 @@ def _generate_scenarios(
     Returns:
         Combined Scenarios object.
     """
+    from molecule.scenarios import Scenarios  # noqa: PLC0415
+
     scenarios = Scenarios(
         configs,
         scenario_names,
     )
 
     if scenario_names is not None:
-        for scenario_name in scenario_names:
-            if scenario_name != "*" and scenarios:
+        sequences = {scenario.name: scenario.sequence for scenario in scenarios.all}
+        for scenario_name in dict.fromkeys(scenario_names):
+            if scenario_name != "*":
                 LOG.info(
                     "%s scenario test matrix: %s",
                     scenario_name,
-                    ", ".join(scenarios.sequence(scenario_name)),
+                    ", ".join(sequences[scenario_name]),
                 )
 
     return scenarios
@@ -210,45 +215,35 @@ def _run_scenarios(
     if create_results is not None:
         scenarios.results.append(create_results)
 
+    is_reset = command_args.get("subcommand") == "reset"
+    is_parallel = bool(command_args.get("parallel"))
+    concurrent: list[Scenario] = []
     for scenario in scenarios.all:
-        if scenario.config.config["prerun"]:
-            role_name_check = scenario.config.config["role_name_check"]
+        cfg = scenario.config
+        scenario_config = cfg.config
+        if scenario_config["prerun"]:
+            role_name_check = scenario_config["role_name_check"]
             LOG.info("Performing prerun with role_name_check=%s...", role_name_check)
-            scenario.config.runtime.prepare_environment(
+            cfg.runtime.prepare_environment(
                 install_local=True,
                 role_name_check=role_name_check,
             )
 
-        if command_args.get("subcommand") == "reset":
+        if is_reset:
+            import shutil  # noqa: PLC0415
+
             LOG.info("Removing %s", scenario.ephemeral_directory)
             shutil.rmtree(scenario.ephemeral_directory)
             return
-        try:
-            execute_scenario(scenario)
-            scenarios.results.append({"name": scenario.name, "results": scenario.results})
-        except ScenarioFailureError:
-            # if the command has a 'destroy' arg, like test does,
-            # handle that behavior here.
-            if command_args.get("destroy") == "always":
-                msg = (
-                    f"An error occurred during the {scenario.config.subcommand} sequence action: "
-                    f"'{scenario.config.action}'. Cleaning up."
-                )
-                LOG.warning(msg)
-                execute_subcommand(scenario.config, "cleanup")
-                destroy_results = execute_subcommand_default(default_config, "destroy")
-                if destroy_results is not None:
-                    scenarios.results.append({"name": scenario.name, "results": scenario.results})
-                    scenarios.results.append(destroy_results)
-                else:
-                    execute_subcommand(scenario.config, "destroy")
-                    scenarios.results.append({"name": scenario.name, "results": scenario.results})
-
-                # always prune ephemeral dir if destroying on failure
-                scenario.prune()
-                if scenario.config.is_parallel:
-                    scenario._remove_scenario_state_directory()  # noqa: SLF001
-            raise
+        if is_parallel and cfg.shared_data is not True:
+            # Independent scenarios in parallel mode are run concurrently below.
+            concurrent.append(scenario)
+            continue
+
+        _run_scenario(scenario, scenarios.results, command_args, default_config)
+
+    if concurrent:
+        _run_scenarios_concurrently(concurrent, scenarios.results, command_args, default_config)
 
     # Run final destroy
     destroy_results = execute_subcommand_default(default_config, "destroy")
@@ -256,6 +251,90 @@ def _run_scenarios(
         scenarios.results.append(destroy_results)
 
 
+def _run_scenarios_concurrently(
+    scenarios: list[Scenario],
+    results: list[ScenariosResults],
+    command_args: CommandArgs,
+    default_config: config.Config | None,
+) -> None:
+    """Run independent scenarios concurrently.
+
+    Each scenario runs in a worker thread, as its time is mostly spent waiting
+    on ansible-playbook subprocesses. Concurrency is capped to leave two CPUs
+    free, and every scenario is allowed to finish before the first failure is
+    raised. Results are appended in scenario order, not completion order.
+
+    Args:
+        scenarios: The Scenario objects to execute.
+        results: List the results of each scenario are appended to.
+        command_args: dict of command arguments.
+        default_config: Molecule Config object for the default scenario.
+
+    Raises:
+        ScenarioFailureError: when a scenario fails prematurely.
+    """
+    scenario_results: list[list[ScenariosResults]] = [[] for _ in scenarios]
+    max_workers = min(len(scenarios), max(1, (os.cpu_count() or 1) - 2))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_run_scenario, scenario, own_results, command_args, default_config)
+            for scenario, own_results in zip(scenarios, scenario_results, strict=True)
+        ]
+
+    for own_results in scenario_results:
+        results.extend(own_results)
+    for future in futures:
+        exc = future.exception()
+        if exc is not None:
+            raise exc
+
+
+def _run_scenario(
+    scenario: Scenario,
+    results: list[ScenariosResults],
+    command_args: CommandArgs,
+    default_config: config.Config | None,
+) -> None:
+    """Execute a single scenario, cleaning up after it on failure if requested.
+
+    Args:
+        scenario: The Scenario object to execute.
+        results: List the results of the scenario are appended to.
+        command_args: dict of command arguments.
+        default_config: Molecule Config object for the default scenario.
+
+    Raises:
+        ScenarioFailureError: when the scenario fails prematurely.
+    """
+    try:
+        execute_scenario(scenario)
+        results.append({"name": scenario.name, "results": scenario.results})
+    except ScenarioFailureError:
+        # if the command has a 'destroy' arg, like test does,
+        # handle that behavior here.
+        if command_args.get("destroy") == "always":
+            cfg = scenario.config
+            msg = (
+                f"An error occurred during the {cfg.subcommand} sequence action: "
+                f"'{cfg.action}'. Cleaning up."
+            )
+            LOG.warning(msg)
+            execute_subcommand(cfg, "cleanup")
+            destroy_results = execute_subcommand_default(default_config, "destroy")
+            if destroy_results is not None:
+                results.append({"name": scenario.name, "results": scenario.results})
+                results.append(destroy_results)
+            else:
+                execute_subcommand(cfg, "destroy")
+                results.append({"name": scenario.name, "results": scenario.results})
+
+            # always prune ephemeral dir if destroying on failure
+            scenario.prune()
+            if cfg.is_parallel:
+                scenario._remove_scenario_state_directory()  # noqa: SLF001
+        raise
+
+
 def execute_subcommand_default(
     default_config: config.Config | None,
     subcommand: str,
@@ -276,7 +355,7 @@ def execute_subcommand_default(
     default = default_config.scenario
     if subcommand in default.sequence:
         execute_subcommand(default_config, subcommand)
-        results: ScenariosResults = {"name": default.name, "results": copy.copy(default.results)}
+        results: ScenariosResults = {"name": default.name, "results": default.results}
         # clear results for later reuse
         default.results = []
         return results
@@ -297,9 +376,17 @@ def execute_subcommand(
     Returns:
         The result of the subcommand.
     """
-    (subcommand, *args) = subcommand_and_args.split(" ")
-    command_module = importlib.import_module(f"molecule.command.{subcommand}")
-    command = getattr(command_module, text.camelize(subcommand))
+    # Sequence actions are almost always a bare subcommand name.
+    if " " in subcommand_and_args:
+        subcommand, _, rest = subcommand_and_args.partition(" ")
+        args = rest.split(" ")
+    else:
+        subcommand, args = subcommand_and_args, []
+    command = _SUBCOMMAND_CACHE.get(subcommand)
+    if command is None:
+        command_module = importlib.import_module(f"molecule.command.{subcommand}")
+        command = getattr(command_module, text.camelize(subcommand))
+        _SUBCOMMAND_CACHE[subcommand] = command
 
     # knowledge of the current action is used by some provisioners
     # to ensure they behave correctly during certain sequence steps,
@@ -344,8 +431,17 @@ def filter_ignored_scenarios(scenario_paths: list[str]) -> list[str]:
     Returns:
         Filtered list of scenario paths.
     """
-    command = ["git", "check-ignore", *scenario_paths]
+    if not scenario_paths:
+        return scenario_paths
+
+    # Outside of a git work tree there is nothing to ignore.
+    if not _in_git_work_tree(Path.cwd()):
+        return scenario_paths
 
+    import contextlib  # noqa: PLC0415
+    import subprocess  # noqa: PLC0415
+
+    command = ["git", "check-ignore", *scenario_paths]
     with contextlib.suppress(subprocess.CalledProcessError, FileNotFoundError):
         proc = subprocess.run(
             args=command,
@@ -354,14 +450,79 @@ def filter_ignored_scenarios(scenario_paths: list[str]) -> list[str]:
             text=True,
             shell=False,
         )
+        ignored = set(proc.stdout.split("\n"))
+        return [candidate for candidate in scenario_paths if str(candidate) not in ignored]
 
-    try:
-        ignored = proc.stdout.splitlines()
-        paths = [candidate for candidate in scenario_paths if str(candidate) not in ignored]
-    except NameError:
-        paths = scenario_paths
+    return scenario_paths
+
+
+def _in_git_work_tree(path: Path) -> bool:
+    """Return whether a path may be inside a git work tree.
+
+    Args:
+        path: The directory to check.
+
+    Returns:
+        True if GIT_DIR is set or path or one of its parents has a .git entry.
+    """
+    return "GIT_DIR" in os.environ or any((p / ".git").exists() for p in (path, *path.parents))
+
+
+def _glob_scenario_paths(glob_str: str) -> list[str]:
+    """Return the paths matching a scenario glob.
+
+    Literal paths only need an existence check, and the default
+    ``molecule/*/molecule.yml`` form is resolved with a single directory scan.
+    Only globs using other syntax, such as braces or globstars, go through
+    wcmatch.
+
+    Args:
+        glob_str: A string representing the glob used to find Molecule config files.
+
+    Returns:
+        List of matching paths.
+    """
+    if not _has_glob_magic(glob_str):
+        return [glob_str] if Path(glob_str).exists() else []
+
+    parts = glob_str.split("/")
+    if (
+        len(parts) == 3  # noqa: PLR2004
+        and parts[1] == "*"
+        and parts[0]
+        and not _has_glob_magic(parts[0])
+        and not _has_glob_magic(parts[2])
+    ):
+        try:
+            entries = list(os.scandir(parts[0]))
+        except OSError:
+            return []
+        return [
+            f"{entry.path}/{parts[2]}"
+            for entry in entries
+            if entry.is_dir() and Path(entry.path, parts[2]).is_file()
+        ]
+
+    import wcmatch.pathlib  # noqa: PLC0415
+
+    from wcmatch import glob  # noqa: PLC0415
+
+    return glob.glob(
+        glob_str,
+        flags=wcmatch.pathlib.GLOBSTAR | wcmatch.pathlib.BRACE | wcmatch.pathlib.DOTGLOB,
+    )
 
-    return paths
+
+def _has_glob_magic(pattern: str) -> bool:
+    """Return whether a pattern uses any glob syntax.
+
+    Args:
+        pattern: The pattern to check.
+
+    Returns:
+        True if the pattern contains glob syntax.
+    """
+    return any(ch in _GLOB_MAGIC for ch in pattern)
 
 
 def get_configs(
@@ -381,23 +542,30 @@ def get_configs(
         glob_str: A string representing the glob used to find Molecule config files.
 
     Returns:
-        A list of Config objects.
+        A list of Config objects. New objects are created on every call, as
+        scenarios record their results on them.
     """
-    scenario_paths = glob.glob(
-        glob_str,
-        flags=wcmatch.pathlib.GLOBSTAR | wcmatch.pathlib.BRACE | wcmatch.pathlib.DOTGLOB,
-    )
-
-    scenario_paths = filter_ignored_scenarios(scenario_paths)
-    configs = [
-        config.Config(
-            molecule_file=util.abs_path(c),
+    scenario_paths = _glob_scenario_paths(glob_str)
+    # A literal path names one scenario explicitly, so there is no need to
+    # ask git whether it is ignored.
+    if _has_glob_magic(glob_str):
+        scenario_paths = filter_ignored_scenarios(scenario_paths)
+
+    def _load(scenario_path: str) -> config.Config:
+        return config.Config(
+            molecule_file=util.abs_path(scenario_path),
             args=args,
             command_args=command_args,
             ansible_args=ansible_args,
         )
-        for c in scenario_paths
-    ]
+
+    # The first config is loaded on its own so that state shared between
+    # configs, such as the ansible runtime, is initialized only once. The
+    # others are read and rendered concurrently, keeping their order.
+    configs = [_load(c) for c in scenario_paths[:1]]
+    if len(scenario_paths) > 1:
+        with ThreadPoolExecutor(max_workers=min(8, len(scenario_paths) - 1)) as executor:
+            configs.extend(executor.map(_load, scenario_paths[1:]))
     _verify_configs(configs, glob_str)
 
     return configs
@@ -414,11 +582,12 @@ def _verify_configs(configs: list[config.Config], glob_str: str = MOLECULE_GLOB)
         ScenarioFailureError: When scenario configs cannot be verified.
     """
     if configs:
-        scenario_names = [c.scenario.name for c in configs]
-        for scenario_name, n in collections.Counter(scenario_names).items():
-            if n > 1:
+        seen: set[str] = set()
+        for scenario_name in (c.scenario.name for c in configs):
+            if scenario_name in seen:
                 msg = f"Duplicate scenario name '{scenario_name}' found.  Exiting."
                 raise ScenarioFailureError(message=msg)
+            seen.add(scenario_name)
 
     else:
         msg = f"'{glob_str}' glob failed.  Exiting."
@@ -434,12 +603,133 @@ def _get_subcommand(string: str) -> str:
     Returns:
         A string representing the subcommand.
     """
-    return string.split(".")[-1]
+    return string.rpartition(".")[2]
+
+
+class LazyGroup(HelpColorsGroup):
+    """Click group which imports its subcommands only when they are used.
+
+    Subcommands are given as a mapping of command name to the dotted path of
+    the click command, e.g. ``{"list": "molecule.command.list.list_"}``.
+    """
+
+    def __init__(
+        self,
+        *args: Any,  # noqa: ANN401
+        lazy_subcommands: dict[str, str] | None = None,
+        **kwargs: Any,  # noqa: ANN401
+    ) -> None:
+        """Construct a LazyGroup.
+
+        Args:
+            *args: Positional arguments passed to HelpColorsGroup.
+            lazy_subcommands: Mapping of subcommand names to dotted import paths.
+            **kwargs: Keyword arguments passed to HelpColorsGroup.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """Return the names of both loaded and lazy subcommands.
+
+        Args:
+            ctx: Click context object.
+
+        Returns:
+            Sorted list of subcommand names.
+        """
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Return a subcommand, importing it on first use.
+
+        Args:
+            ctx: Click context object.
+            cmd_name: Name of the subcommand.
+
+        Returns:
+            The click command, or None when it does not exist.
+        """
+        if cmd_name not in self.commands and cmd_name in self.lazy_subcommands:
+            module_name, _, attr = self.lazy_subcommands[cmd_name].rpartition(".")
+            module = importlib.import_module(module_name)
+            self.add_command(getattr(module, attr), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+class DriverChoice(click.ParamType):
+    """Choice of installed driver names, discovered only when a value is given.
+
+    Unlike ``click.Choice``, building the option does not scan driver plugins,
+    which keeps unrelated commands and ``--help`` fast.
+    """
+
+    name = "driver"
+
+    def get_metavar(
+        self,
+        param: click.Parameter,  # noqa: ARG002
+        ctx: click.Context | None = None,  # noqa: ARG002
+    ) -> str:
+        """Return the metavar shown in help output.
+
+        Args:
+            param: The option using this type.
+            ctx: Click context object.
+
+        Returns:
+            Static metavar string.
+        """
+        return "DRIVER"
+
+    def convert(
+        self,
+        value: Any,  # noqa: ANN401
+        param: click.Parameter | None,
+        ctx: click.Context | None,
+    ) -> Any:  # noqa: ANN401
+        """Validate the value against the installed drivers.
+
+        Args:
+            value: The value given on the command line.
+            param: The option using this type.
+            ctx: Click context object.
+
+        Returns:
+            The validated driver name.
+        """
+        return self._choice().convert(value, param, ctx)
+
+    def shell_complete(
+        self,
+        ctx: click.Context,
+        param: click.Parameter,
+        incomplete: str,
+    ) -> list[CompletionItem]:
+        """Complete driver names.
+
+        Args:
+            ctx: Click context object.
+            param: The option using this type.
+            incomplete: Partial value to complete.
+
+        Returns:
+            Matching driver names.
+        """
+        return self._choice().shell_complete(ctx, param, incomplete)
+
+    @staticmethod
+    def _choice() -> click.Choice:
+        return click.Choice([str(s) for s in api.drivers()])
 
 
-def click_group_ex() -> ClickGroup:
+def click_group_ex(lazy_subcommands: dict[str, str] | None = None) -> ClickGroup:
     """Return extended version of click.group().
 
+    Args:
+        lazy_subcommands: Mapping of subcommand names to the dotted path of
+            the click command implementing them, imported only when needed.
+
     Returns:
         Click command group.
     """
@@ -449,7 +739,7 @@ def click_group_ex() -> ClickGroup:
     # blue : molecule own command, not dependent on scenario
     # yellow : special commands, like full test sequence, or login
     return click.group(
-        cls=HelpColorsGroup,
+        cls=LazyGroup,
         # Workaround to disable click help line truncation to ~80 chars
         # https://github.com/pallets/click/issues/486
         context_settings={
@@ -469,6 +759,7 @@ def click_group_ex() -> ClickGroup:
             "test": "bright_yellow",
         },
         result_callback=result_callback,
+        lazy_subcommands=lazy_subcommands,
     )
 
 
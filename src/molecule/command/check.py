@@ -37,6 +37,7 @@ if TYPE_CHECKING:
 
 
 LOG = logging.getLogger(__name__)
+_SUBCOMMAND = base._get_subcommand(__name__)  # noqa: SLF001
 
 
 class Check(base.Base):
@@ -63,8 +64,8 @@ class Check(base.Base):
 def check(  # noqa: PLR0913
     ctx: click.Context,
     /,
-    scenario_name: list[str] | None,
-    exclude: list[str],
+    scenario_name: tuple[str, ...],
+    exclude: tuple[str, ...],
     __all: bool,  # noqa: FBT001
     *,
     parallel: bool,
@@ -86,19 +87,17 @@ def check(  # noqa: PLR0913
         shared_state: Whether the (some) state should be shared between scenarios.
     """  # noqa: D301
     args: MoleculeArgs = ctx.obj.get("args")
-    subcommand = base._get_subcommand(__name__)  # noqa: SLF001
     command_args: CommandArgs = {
         "parallel": parallel,
-        "subcommand": subcommand,
+        "subcommand": _SUBCOMMAND,
         "report": report,
         "shared_inventory": shared_inventory,
         "shared_state": shared_state,
     }
 
-    if __all:
-        scenario_name = None
+    scenario_names = None if __all else list(scenario_name)
 
     if parallel:
         util.validate_parallel_cmd_args(command_args)
 
-    base.execute_cmdline_scenarios(scenario_name, args, command_args, excludes=exclude)
+    base.execute_cmdline_scenarios(scenario_names, args, command_args, excludes=list(exclude))
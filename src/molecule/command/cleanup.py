@@ -35,6 +35,7 @@ if TYPE_CHECKING:
 
 
 LOG = logging.getLogger(__name__)
+_SUBCOMMAND = base._get_subcommand(__name__)  # noqa: SLF001
 
 
 class Cleanup(base.Base):
@@ -61,8 +62,8 @@ class Cleanup(base.Base):
 def cleanup(  # noqa: PLR0913
     ctx: click.Context,
     /,
-    scenario_name: list[str] | None,
-    exclude: list[str],
+    scenario_name: tuple[str, ...],
+    exclude: tuple[str, ...],
     *,
     __all: bool,
     report: bool,
@@ -84,15 +85,13 @@ def cleanup(  # noqa: PLR0913
         shared_state: Whether the (some) state should be shared between scenarios.
     """  # noqa: D301
     args: MoleculeArgs = ctx.obj.get("args")
-    subcommand = base._get_subcommand(__name__)  # noqa: SLF001
     command_args: CommandArgs = {
-        "subcommand": subcommand,
+        "subcommand": _SUBCOMMAND,
         "report": report,
         "shared_inventory": shared_inventory,
         "shared_state": shared_state,
     }
 
-    if __all:
-        scenario_name = None
+    scenario_names = None if __all else list(scenario_name)
 
-    base.execute_cmdline_scenarios(scenario_name, args, command_args, excludes=exclude)
+    base.execute_cmdline_scenarios(scenario_names, args, command_args, excludes=list(exclude))
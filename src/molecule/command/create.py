@@ -27,7 +27,6 @@ from typing import TYPE_CHECKING
 
 import click
 
-from molecule.api import drivers
 from molecule.command import base
 from molecule.config import DEFAULT_DRIVER
 
@@ -37,6 +36,7 @@ if TYPE_CHECKING:
 
 
 LOG = logging.getLogger(__name__)
+_SUBCOMMAND = base._get_subcommand(__name__)  # noqa: SLF001
 
 
 class Create(base.Base):
@@ -67,14 +67,14 @@ class Create(base.Base):
 @click.option(
     "--driver-name",
     "-d",
-    type=click.Choice([str(s) for s in drivers()]),
+    type=base.DriverChoice(),
     help=f"Name of driver to use. ({DEFAULT_DRIVER})",
 )
 def create(  # noqa: PLR0913
     ctx: click.Context,
     /,
-    scenario_name: list[str] | None,
-    exclude: list[str],
+    scenario_name: tuple[str, ...],
+    exclude: tuple[str, ...],
     driver_name: str,
     __all: bool,  # noqa: FBT001
     *,
@@ -96,16 +96,14 @@ def create(  # noqa: PLR0913
         shared_state: Whether the (some) state should be shared between scenarios.
     """  # noqa: D301
     args: MoleculeArgs = ctx.obj.get("args")
-    subcommand = base._get_subcommand(__name__)  # noqa: SLF001
     command_args: CommandArgs = {
-        "subcommand": subcommand,
+        "subcommand": _SUBCOMMAND,
         "driver_name": driver_name,
         "report": report,
         "shared_inventory": shared_inventory,
         "shared_state": shared_state,
     }
 
-    if __all:
-        scenario_name = None
+    scenario_names = None if __all else list(scenario_name)
 
-    base.execute_cmdline_scenarios(scenario_name, args, command_args, excludes=exclude)
+    base.execute_cmdline_scenarios(scenario_names, args, command_args, excludes=list(exclude))
@@ -28,7 +28,6 @@ from typing import TYPE_CHECKING
 import click
 
 from molecule import util
-from molecule.api import drivers
 from molecule.command import base
 from molecule.config import DEFAULT_DRIVER, MOLECULE_PARALLEL
 
@@ -38,6 +37,7 @@ if TYPE_CHECKING:
 
 
 LOG = logging.getLogger(__name__)
+_SUBCOMMAND = base._get_subcommand(__name__)  # noqa: SLF001
 
 
 class Destroy(base.Base):
@@ -65,7 +65,7 @@ class Destroy(base.Base):
 @click.option(
     "--driver-name",
     "-d",
-    type=click.Choice([str(s) for s in drivers()]),
+    type=base.DriverChoice(),
     help=f"Name of driver to use. ({DEFAULT_DRIVER})",
 )
 @click.option(
@@ -76,8 +76,8 @@ class Destroy(base.Base):
 def destroy(  # noqa: PLR0913
     ctx: click.Context,
     /,
-    scenario_name: list[str] | None,
-    exclude: list[str],
+    scenario_name: tuple[str, ...],
+    exclude: tuple[str, ...],
     driver_name: str,
     __all: bool,  # noqa: FBT001
     *,
@@ -101,20 +101,18 @@ def destroy(  # noqa: PLR0913
         shared_state: Whether the (some) state should be shared between scenarios.
     """  # noqa: D301
     args: MoleculeArgs = ctx.obj.get("args")
-    subcommand = base._get_subcommand(__name__)  # noqa: SLF001
     command_args: CommandArgs = {
         "parallel": parallel,
-        "subcommand": subcommand,
+        "subcommand": _SUBCOMMAND,
         "driver_name": driver_name,
         "report": report,
         "shared_inventory": shared_inventory,
         "shared_state": shared_state,
     }
 
-    if __all:
-        scenario_name = None
+    scenario_names = None if __all else list(scenario_name)
 
     if parallel:
         util.validate_parallel_cmd_args(command_args)
 
-    base.execute_cmdline_scenarios(scenario_name, args, command_args, excludes=exclude)
+    base.execute_cmdline_scenarios(scenario_names, args, command_args, excludes=list(exclude))
@@ -43,6 +43,7 @@ if TYPE_CHECKING:
 
 
 LOG = logging.getLogger(__name__)
+_SUBCOMMAND = base._get_subcommand(__name__)  # noqa: SLF001
 
 
 class List(base.Base):
@@ -87,8 +88,7 @@ def list_(
         format: Output format type.
     """  # noqa: D301
     args: MoleculeArgs = ctx.obj.get("args")
-    subcommand = base._get_subcommand(__name__)  # noqa: SLF001
-    command_args: CommandArgs = {"subcommand": subcommand, "format": format}
+    command_args: CommandArgs = {"subcommand": _SUBCOMMAND, "format": format}
 
     statuses = []
     s = scenarios.Scenarios(
@@ -96,7 +96,7 @@ def list_(
         None if scenario_name is None else [scenario_name],
     )
     for scenario in s:
-        statuses.extend(base.execute_subcommand(scenario.config, subcommand))
+        statuses.extend(base.execute_subcommand(scenario.config, _SUBCOMMAND))
 
     headers = [text.title(name) for name in Status._fields]
     if format in ["simple", "plain"]:
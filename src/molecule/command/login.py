@@ -41,6 +41,7 @@ if TYPE_CHECKING:
 
 
 LOG = logging.getLogger(__name__)
+_SUBCOMMAND = base._get_subcommand(__name__)  # noqa: SLF001
 
 
 class Login(base.Base):
@@ -142,9 +143,8 @@ def login(
         scenario_name: Name of the scenario to target.
     """  # noqa: D301
     args = ctx.obj.get("args")
-    subcommand = base._get_subcommand(__name__)  # noqa: SLF001
-    command_args: CommandArgs = {"subcommand": subcommand, "host": host}
+    command_args: CommandArgs = {"subcommand": _SUBCOMMAND, "host": host}
 
     s = scenarios.Scenarios(base.get_configs(args, command_args), [scenario_name])
     for scenario in s.all:
-        base.execute_subcommand(scenario.config, subcommand)
+        base.execute_subcommand(scenario.config, _SUBCOMMAND)
@@ -27,7 +27,6 @@ from typing import TYPE_CHECKING
 
 import click
 
-from molecule.api import drivers
 from molecule.command import base
 from molecule.config import DEFAULT_DRIVER
 
@@ -37,6 +36,7 @@ if TYPE_CHECKING:
 
 
 LOG = logging.getLogger(__name__)
+_SUBCOMMAND = base._get_subcommand(__name__)  # noqa: SLF001
 
 
 class Prepare(base.Base):
@@ -98,19 +98,23 @@ class Prepare(base.Base):
         Args:
             action_args: Arguments for this command. Unused.
         """
-        if self._config.state.prepared and not self._config.command_args.get("force"):
+        state = self._config.state
+        if state.prepared and not self._config.command_args.get("force"):
             msg = "Skipping, instances already prepared."
             LOG.warning(msg)
             return
 
-        if self._config.provisioner:
-            if not self._config.provisioner.playbooks.prepare:
-                msg = "Skipping, prepare playbook not configured."
-                LOG.warning(msg)
-                return
+        provisioner = self._config.provisioner
+        if provisioner is None:
+            return
+
+        if not provisioner.playbooks.prepare:
+            msg = "Skipping, prepare playbook not configured."
+            LOG.warning(msg)
+            return
 
-            self._config.provisioner.prepare()
-            self._config.state.change_state("prepared", value=True)
+        provisioner.prepare()
+        state.change_state("prepared", value=True)
 
 
 @base.click_command_ex()
@@ -119,7 +123,7 @@ class Prepare(base.Base):
 @click.option(
     "--driver-name",
     "-d",
-    type=click.Choice([str(s) for s in drivers()]),
+    type=base.DriverChoice(),
     help=f"Name of driver to use. ({DEFAULT_DRIVER})",
 )
 @click.option(
@@ -131,8 +135,8 @@ class Prepare(base.Base):
 def prepare(  # noqa: PLR0913
     ctx: click.Context,
     /,
-    scenario_name: list[str] | None,
-    exclude: list[str],
+    scenario_name: tuple[str, ...],
+    exclude: tuple[str, ...],
     driver_name: str,
     __all: bool,  # noqa: FBT001
     *,
@@ -156,9 +160,8 @@ def prepare(  # noqa: PLR0913
         shared_state: Whether the (some) state should be shared between scenarios.
     """  # noqa: D301
     args: MoleculeArgs = ctx.obj.get("args")
-    subcommand = base._get_subcommand(__name__)  # noqa: SLF001
     command_args: CommandArgs = {
-        "subcommand": subcommand,
+        "subcommand": _SUBCOMMAND,
         "driver_name": driver_name,
         "force": force,
         "report": report,
@@ -166,7 +169,6 @@ def prepare(  # noqa: PLR0913
         "shared_state": shared_state,
     }
 
-    if __all:
-        scenario_name = None
+    scenario_names = None if __all else list(scenario_name)
 
-    base.execute_cmdline_scenarios(scenario_name, args, command_args, excludes=exclude)
+    base.execute_cmdline_scenarios(scenario_names, args, command_args, excludes=list(exclude))
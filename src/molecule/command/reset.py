@@ -36,6 +36,7 @@ if TYPE_CHECKING:
 
 
 LOG = logging.getLogger(__name__)
+_SUBCOMMAND = base._get_subcommand(__name__)  # noqa: SLF001
 
 
 @base.click_command_ex()
@@ -58,8 +59,7 @@ def reset(
         scenario_name: Name of the scenario to target.
     """  # noqa: D301
     args: MoleculeArgs = ctx.obj.get("args")
-    subcommand = base._get_subcommand(__name__)  # noqa: SLF001
-    command_args: CommandArgs = {"subcommand": subcommand}
+    command_args: CommandArgs = {"subcommand": _SUBCOMMAND}
 
     base.execute_cmdline_scenarios([scenario_name], args, command_args)
     for driver in drivers().values():
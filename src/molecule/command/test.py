@@ -29,7 +29,6 @@ from typing import TYPE_CHECKING
 import click
 
 from molecule import util
-from molecule.api import drivers
 from molecule.command import base
 from molecule.config import DEFAULT_DRIVER, MOLECULE_PARALLEL
 
@@ -41,6 +40,7 @@ if TYPE_CHECKING:
 
 
 LOG = logging.getLogger(__name__)
+_SUBCOMMAND = base._get_subcommand(__name__)  # noqa: SLF001
 MOLECULE_PLATFORM_NAME = os.environ.get("MOLECULE_PLATFORM_NAME", None)
 
 
@@ -67,7 +67,7 @@ class Test(base.Base):
 @click.option(
     "--driver-name",
     "-d",
-    type=click.Choice([str(s) for s in drivers()]),
+    type=base.DriverChoice(),
     help=f"Name of driver to use. ({DEFAULT_DRIVER})",
 )
 @click.option(
@@ -85,8 +85,8 @@ class Test(base.Base):
 def test(  # noqa: PLR0913
     ctx: click.Context,
     /,
-    scenario_name: list[str] | None,
-    exclude: list[str],
+    scenario_name: tuple[str, ...],
+    exclude: tuple[str, ...],
     driver_name: str,
     __all: bool,  # noqa: FBT001
     *,
@@ -116,11 +116,10 @@ def test(  # noqa: PLR0913
         shared_state: Whether the (some) state should be shared between scenarios.
     """  # noqa: D301
     args: MoleculeArgs = ctx.obj.get("args")
-    subcommand = base._get_subcommand(__name__)  # noqa: SLF001
     command_args: CommandArgs = {
         "parallel": parallel,
         "destroy": destroy,
-        "subcommand": subcommand,
+        "subcommand": _SUBCOMMAND,
         "driver_name": driver_name,
         "platform_name": platform_name,
         "report": report,
@@ -128,10 +127,9 @@ def test(  # noqa: PLR0913
         "shared_state": shared_state,
     }
 
-    if __all:
-        scenario_name = None
+    scenario_names = None if __all else list(scenario_name)
 
     if parallel:
         util.validate_parallel_cmd_args(command_args)
 
-    base.execute_cmdline_scenarios(scenario_name, args, command_args, ansible_args, exclude)
+    base.execute_cmdline_scenarios(scenario_names, args, command_args, ansible_args, list(exclude))
@@ -136,7 +136,7 @@ class Config:
 
     def write(self) -> None:
         """Write config file to filesystem."""
-        util.write_file(self.config_file, util.safe_dump(self.config))
+        util.write_file_if_changed(self.config_file, util.safe_dump(self.config))
 
     @property
     def config_file(self) -> str:
@@ -36,7 +36,7 @@ from molecule.text import underscore
 
 
 if TYPE_CHECKING:
-    from collections.abc import Callable, Iterable
+    from collections.abc import Callable
     from typing import Any, ParamSpec, TypeVar
 
     from molecule.config import Config
@@ -254,20 +254,24 @@ def section_logger(func: Callable[P, R]) -> Callable[P, R]:
 
 
 @cache
-def get_section_loggers() -> Iterable[Callable[..., Any]]:
-    """Return a list of section wrappers to be added.
+def get_section_loggers() -> tuple[Callable[..., Any], ...]:
+    """Return the section wrappers to be added.
+
+    The result is computed once and shared by every command class, so it is
+    returned as a tuple. Call ``get_section_loggers.cache_clear()`` to detect
+    the CI environment again.
 
     Returns:
-        A list of logging decorators.
+        A tuple of logging decorators.
     """
-    default_section_loggers = [section_logger]
+    default_section_loggers = (section_logger,)
     if not os.getenv("CI"):
         return default_section_loggers
     if os.getenv("GITHUB_ACTIONS"):
-        return [github_actions_groups, *default_section_loggers]
+        return (github_actions_groups, *default_section_loggers)
     if os.getenv("GITLAB_CI"):
-        return [gitlab_ci_sections, *default_section_loggers]
+        return (gitlab_ci_sections, *default_section_loggers)
     if os.getenv("TRAVIS"):
-        return [travis_ci_folds, *default_section_loggers]
+        return (travis_ci_folds, *default_section_loggers)
     # CI is set but no extra section_loggers apply.
     return default_section_loggers
@@ -773,7 +773,7 @@ class Ansible(base.Base):
             self._get_config_template(),
             config_options=self.config_options,
         )
-        util.write_file(self.config_file, template)
+        util.write_file_if_changed(self.config_file, template)
 
     def manage_inventory(self) -> None:
         """Manage inventory for Ansible and returns None."""
@@ -827,7 +827,7 @@ class Ansible(base.Base):
         """Write the provisioner's inventory file to disk and returns None."""
         self._verify_inventory()
 
-        util.write_file(self.inventory_file, util.safe_dump(self.inventory))
+        util.write_file_if_changed(self.inventory_file, util.safe_dump(self.inventory))
 
     def _remove_vars(self) -> None:
         """Remove hosts/host_vars/group_vars and returns None."""
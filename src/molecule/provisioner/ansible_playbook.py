@@ -24,6 +24,7 @@ from __future__ import annotations
 import logging
 import shlex
 import subprocess
+import threading
 import warnings
 
 from typing import TYPE_CHECKING
@@ -41,6 +42,9 @@ if TYPE_CHECKING:
 
 
 LOG = logging.getLogger(__name__)
+# warnings.catch_warnings swaps process-wide state, so scenarios running in
+# parallel threads must not capture warnings at the same time.
+_WARNINGS_LOCK = threading.Lock()
 
 
 class AnsiblePlaybook:
@@ -170,16 +174,17 @@ class AnsiblePlaybook:
             )
             return ""
 
-        with warnings.catch_warnings(record=True) as warns:
+        with _WARNINGS_LOCK, warnings.catch_warnings(record=True) as warns:
             warnings.filterwarnings("default", category=MoleculeRuntimeWarning)
             self._config.driver.sanity_checks()
-            cwd = self._config.scenario_path
-            result = self._config.app.run_command(
-                cmd=self._ansible_command,
-                env=self._env,
-                debug=self._config.debug,
-                cwd=cwd,
-            )
+
+        cwd = self._config.scenario_path
+        result = self._config.app.run_command(
+            cmd=self._ansible_command,
+            env=self._env,
+            debug=self._config.debug,
+            cwd=cwd,
+        )
 
         if result.returncode != 0:
             self._config.scenario.results.append(
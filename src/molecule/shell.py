@@ -32,7 +32,7 @@ import packaging
 
 import molecule
 
-from molecule import command, logger
+from molecule import logger
 from molecule.api import drivers
 from molecule.app import get_app
 from molecule.command.base import click_group_ex
@@ -96,7 +96,28 @@ def print_version(
     ctx.exit()
 
 
-@click_group_ex()
+@click_group_ex(
+    lazy_subcommands={
+        "check": "molecule.command.check.check",
+        "cleanup": "molecule.command.cleanup.cleanup",
+        "converge": "molecule.command.converge.converge",
+        "create": "molecule.command.create.create",
+        "dependency": "molecule.command.dependency.dependency",
+        "destroy": "molecule.command.destroy.destroy",
+        "drivers": "molecule.command.drivers.drivers",
+        "idempotence": "molecule.command.idempotence.idempotence",
+        "init": "molecule.command.init.init.init",
+        "list": "molecule.command.list.list_",
+        "login": "molecule.command.login.login",
+        "matrix": "molecule.command.matrix.matrix",
+        "prepare": "molecule.command.prepare.prepare",
+        "reset": "molecule.command.reset.reset",
+        "side-effect": "molecule.command.side_effect.side_effect",
+        "syntax": "molecule.command.syntax.syntax",
+        "test": "molecule.command.test.test",
+        "verify": "molecule.command.verify.verify",
+    },
+)
 @click.option(
     "--debug/--no-debug",
     default=MOLECULE_DEBUG,
@@ -174,23 +195,3 @@ def main(
 
     if "MOLECULE_REPORT" in os.environ:
         atexit.register(do_report)
-
-
-main.add_command(command.cleanup.cleanup)
-main.add_command(command.check.check)
-main.add_command(command.converge.converge)
-main.add_command(command.create.create)
-main.add_command(command.dependency.dependency)
-main.add_command(command.destroy.destroy)
-main.add_command(command.drivers.drivers)
-main.add_command(command.idempotence.idempotence)
-main.add_command(command.init.init)
-main.add_command(command.list.list_)
-main.add_command(command.login.login)
-main.add_command(command.matrix.matrix)
-main.add_command(command.prepare.prepare)
-main.add_command(command.reset.reset)
-main.add_command(command.side_effect.side_effect)
-main.add_command(command.syntax.syntax)
-main.add_command(command.test.test)
-main.add_command(command.verify.verify)
@@ -22,6 +22,7 @@ from __future__ import annotations
 
 import copy
 import fnmatch
+import hashlib
 import logging
 import os
 import re
@@ -55,6 +56,9 @@ if TYPE_CHECKING:
 
 LOG = logging.getLogger(__name__)
 
+# Digest and modification time of the files last written by write_file_if_changed.
+_WRITTEN_FILES: dict[Path, tuple[str, int]] = {}
+
 
 class SafeDumper(yaml.SafeDumper):
     """SafeDumper YAML Class."""
@@ -209,6 +213,40 @@ def write_file(filename: str | Path, content: str, header: str | None = None) ->
     filename.write_text(content)
 
 
+def write_file_if_changed(
+    filename: str | Path,
+    content: str,
+    header: str | None = None,
+) -> bool:
+    """Write a file unless it still holds the content last written to it.
+
+    Args:
+        filename: The target file.
+        content: A string containing the data to be written.
+        header: A header, if None it will use default header.
+
+    Returns:
+        Whether the file was written.
+    """
+    path = Path(filename)
+    # Same text as write_file, which only prepends the default header.
+    if header is None:
+        content = MOLECULE_HEADER + "\n\n" + content
+    digest = hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+    try:
+        mtime: int | None = path.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+
+    if mtime is not None and _WRITTEN_FILES.get(path) == (digest, mtime):
+        return False
+
+    path.parent.mkdir(exist_ok=True)
+    path.write_text(content)
+    _WRITTEN_FILES[path] = (digest, path.stat().st_mtime_ns)
+    return True
+
+
 def molecule_prepender(content: str) -> str:
     """Return molecule identification header.
 
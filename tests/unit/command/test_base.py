@@ -22,10 +22,13 @@ from __future__ import annotations
 
 import os
 import subprocess
+import threading
+import time
 
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
+import click
 import pytest
 
 from molecule import config, util
@@ -38,7 +41,8 @@ if TYPE_CHECKING:
 
     from pytest_mock import MockerFixture
 
-    from molecule.types import CommandArgs, MoleculeArgs
+    from molecule.scenario import Scenario
+    from molecule.types import CommandArgs, MoleculeArgs, ScenariosResults
 
 
 FIXTURE_DIR = Path(__file__).parent.parent.parent / "fixtures" / "unit" / "test_base"
@@ -245,6 +249,67 @@ def test_execute_cmdline_scenarios(patched_execute_scenario: MagicMock) -> None:
     assert patched_execute_scenario.call_count == scenario_count
 
 
+def test_execute_cmdline_scenarios_parallel(
+    mocker: MockerFixture,
+    config_instance: config.Config,
+    patched_execute_subcommand: MagicMock,
+    patched_prune: MagicMock,
+    patched_sysexit: MagicMock,
+) -> None:
+    """Ensure independent scenarios all run in parallel mode, even when one fails.
+
+    - every scenario runs, and the failure is raised once they have finished
+    - the failing scenario is cleaned up and destroyed when destroy == "always"
+    - results are reported in scenario order, not completion order
+
+    Args:
+        mocker: pytest mocker fixture.
+        config_instance: Mocked config_instance fixture.
+        patched_execute_subcommand: Mocked execute_subcommand function.
+        patched_prune: Mocked prune function.
+        patched_sysexit: Mocked util.sysexit function.
+    """
+    molecule_dir = Path(config_instance.molecule_file).parent.parent
+    for name in ("a", "b"):
+        data = {**config_instance.config, "scenario": {"name": name}}
+        util.write_file(molecule_dir / name / "molecule.yml", util.safe_dump(data))
+    b_done = threading.Event()
+    overlapped: list[bool] = []
+
+    def _execute_scenario(scenario: Scenario) -> None:
+        if scenario.name == "a":
+            # Finish after b, so completion order differs from scenario order.
+            overlapped.append(b_done.wait(timeout=5))
+            time.sleep(0.1)
+            raise ScenarioFailureError
+        b_done.set()
+
+    patched_execute_scenario = mocker.patch(
+        "molecule.command.base.execute_scenario",
+        side_effect=_execute_scenario,
+    )
+    mocker.patch("molecule.scenario.Scenario._remove_scenario_state_directory")
+    mocker.patch("os.cpu_count", return_value=4)
+    patched_report = mocker.patch("molecule.command.base.generate_report", return_value="")
+    command_args: CommandArgs = {
+        "destroy": "always",
+        "parallel": True,
+        "report": True,
+        "subcommand": "test",
+    }
+
+    base.execute_cmdline_scenarios(["a", "b"], {}, command_args)
+
+    executed = sorted(c[0][0].name for c in patched_execute_scenario.call_args_list)
+    assert executed == ["a", "b"]
+    assert overlapped == [True]
+    cleanup = [(c[0][0].scenario.name, c[0][1]) for c in patched_execute_subcommand.call_args_list]
+    assert cleanup == [("a", "cleanup"), ("a", "destroy")]
+    assert patched_prune.call_count == 1
+    patched_sysexit.assert_called_once()
+    assert [r["name"] for r in patched_report.call_args[0][0]] == ["a", "b"]
+
+
 @pytest.mark.usefixtures("config_instance")
 def test_execute_cmdline_scenarios_missing(
     caplog: pytest.LogCaptureFixture,
@@ -352,6 +417,53 @@ def test_execute_cmdline_scenarios_exit_destroy(  # noqa: PLR0913
     assert patched_sysexit.called
 
 
+@pytest.mark.usefixtures("config_instance")
+def test_execute_cmdline_scenarios_shared_state_report(mocker: MockerFixture) -> None:
+    """Ensure the default scenario's shared create and destroy are reported on their own.
+
+    Args:
+        mocker: pytest mocker fixture.
+    """
+
+    def _execute_subcommand(current_config: config.Config, subcommand: str) -> None:
+        current_config.scenario.results.append({"subcommand": subcommand, "state": "PASSED"})
+
+    mocker.patch("molecule.command.base.execute_subcommand", side_effect=_execute_subcommand)
+    patched_report = mocker.patch("molecule.command.base.generate_report", return_value="")
+    command_args: CommandArgs = {
+        "destroy": "always",
+        "report": True,
+        "shared_state": True,
+        "subcommand": "test",
+    }
+
+    base.execute_cmdline_scenarios(["default"], {}, command_args)
+
+    results = patched_report.call_args[0][0]
+    actions = [[r["subcommand"] for r in result["results"]] for result in results]
+    create, scenario, destroy = actions
+    assert create == ["create"]
+    assert destroy == ["destroy"]
+    assert "create" not in scenario
+    assert "destroy" not in scenario
+
+
+def test_generate_scenarios_logs_matrix_once(
+    caplog: pytest.LogCaptureFixture,
+    config_instance: config.Config,
+) -> None:
+    """Ensure the test matrix is logged once for a scenario named twice.
+
+    Args:
+        caplog: pytest caplog fixture.
+        config_instance: Mocked config_instance fixture.
+    """
+    with caplog.at_level("INFO"):
+        base._generate_scenarios(["default", "default"], [config_instance])
+
+    assert caplog.text.count("default scenario test matrix: dependency, cleanup, destroy") == 1
+
+
 def test_execute_subcommand(config_instance: config.Config) -> None:
     """Ensure execute_subcommand runs normally.
 
@@ -366,6 +478,59 @@ def test_execute_subcommand(config_instance: config.Config) -> None:
     assert config_instance.action == "list"
 
 
+@pytest.mark.parametrize(
+    ("subcommand_and_args", "expected_args"),
+    (
+        ("fake", []),
+        ("fake foo bar", ["foo", "bar"]),
+    ),
+)
+def test_execute_subcommand_args(
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    subcommand_and_args: str,
+    expected_args: list[str],
+) -> None:
+    """Ensure execute_subcommand passes any arguments following the subcommand.
+
+    Args:
+        mocker: pytest mocker fixture.
+        monkeypatch: pytest monkeypatch fixture.
+        subcommand_and_args: Sequence action to execute.
+        expected_args: Arguments expected to be passed to the command.
+    """
+    command = mocker.Mock()
+    current_config = mocker.Mock()
+    monkeypatch.setitem(base._SUBCOMMAND_CACHE, "fake", command)
+
+    base.execute_subcommand(current_config, subcommand_and_args)
+
+    assert current_config.action == "fake"
+    command.return_value.execute.assert_called_once_with(expected_args)
+
+
+def test_execute_subcommand_cached(
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    config_instance: config.Config,
+) -> None:
+    """Ensure execute_subcommand resolves each command class only once.
+
+    Args:
+        mocker: pytest mocker fixture.
+        monkeypatch: pytest monkeypatch fixture.
+        config_instance: Mocked config_instance fixture.
+    """
+    monkeypatch.delitem(base._SUBCOMMAND_CACHE, "list", raising=False)
+    patched_import_module = mocker.spy(base.importlib, "import_module")
+
+    base.execute_subcommand(config_instance, "list")
+    base.execute_subcommand(config_instance, "list")
+
+    patched_import_module.assert_called_once_with("molecule.command.list")
+    assert base._SUBCOMMAND_CACHE["list"].__name__ == "List"
+
+
 def test_execute_scenario(
     mocker: MockerFixture,
     patched_execute_subcommand: MagicMock,
@@ -454,6 +619,148 @@ def test_get_configs(config_instance: config.Config) -> None:
     assert isinstance(result[0], config.Config)
 
 
+@pytest.mark.parametrize(
+    ("glob_str", "filtered"),
+    (
+        ("molecule/*/molecule.yml", True),
+        ("molecule/default/molecule.yml", False),
+    ),
+)
+def test_get_configs_filter_ignored(
+    mocker: MockerFixture,
+    config_instance: config.Config,
+    glob_str: str,
+    filtered: bool,  # noqa: FBT001
+) -> None:
+    """Ensure git ignores are only checked for globs, not explicit scenario paths.
+
+    Args:
+        mocker: pytest mocker fixture.
+        config_instance: Mocked config_instance fixture.
+        glob_str: Glob passed to get_configs.
+        filtered: Whether filter_ignored_scenarios is expected to be called.
+    """
+    molecule_file = config_instance.molecule_file
+    util.write_file(molecule_file, util.safe_dump(config_instance.config))
+    patched_filter = mocker.patch(
+        "molecule.command.base.filter_ignored_scenarios",
+        side_effect=lambda paths: paths,
+    )
+
+    assert len(base.get_configs({}, {}, glob_str=glob_str)) == 1
+    assert patched_filter.called is filtered
+
+
+def test_get_configs_multiple(config_instance: config.Config) -> None:
+    """Ensure get_configs keeps the glob order when loading several scenarios.
+
+    Args:
+        config_instance: Mocked config_instance fixture.
+    """
+    molecule_dir = Path(config_instance.molecule_file).parent.parent
+    for name in ("a", "b", "c"):
+        data = {**config_instance.config, "scenario": {"name": name}}
+        util.write_file(molecule_dir / name / "molecule.yml", util.safe_dump(data))
+
+    result = base.get_configs({}, {})
+
+    assert [c.molecule_file for c in result] == [
+        util.abs_path(path) for path in base._glob_scenario_paths(base.MOLECULE_GLOB)
+    ]
+    assert sorted(c.scenario.name for c in result) == ["a", "b", "c", "default"]
+
+
+def test_get_configs_not_shared(config_instance: config.Config) -> None:
+    """Ensure get_configs creates new configs on every call.
+
+    Args:
+        config_instance: Mocked config_instance fixture.
+    """
+    molecule_file = config_instance.molecule_file
+    util.write_file(molecule_file, util.safe_dump(config_instance.config))
+
+    args: MoleculeArgs = {}
+    command_args: CommandArgs = {}
+    result = base.get_configs(args, command_args)
+
+    assert base.get_configs(args, command_args)[0] is not result[0]
+
+
+@pytest.mark.parametrize(
+    ("glob_str", "expected"),
+    (
+        ("molecule/*/molecule.yml", ["a", ".b", "c"]),
+        ("molecule/a/molecule.yml", ["a"]),
+        ("molecule/missing/molecule.yml", []),
+        ("molecule/{a,c}/molecule.yml", ["a", "c"]),
+        ("**/molecule.yml", ["a", ".b", "c"]),
+    ),
+)
+def test_glob_scenario_paths(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    glob_str: str,
+    expected: list[str],
+) -> None:
+    """Ensure scenario globs match the same paths with or without wcmatch.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture.
+        tmp_path: pytest tmp_path fixture.
+        glob_str: Glob to resolve.
+        expected: Names of the scenarios expected to match.
+    """
+    for name in ("a", ".b", "c"):
+        (tmp_path / "molecule" / name).mkdir(parents=True)
+        (tmp_path / "molecule" / name / "molecule.yml").touch()
+    (tmp_path / "molecule" / "empty").mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    result = base._glob_scenario_paths(glob_str)
+
+    assert sorted(result) == sorted(f"molecule/{name}/molecule.yml" for name in expected)
+
+
+def test_glob_scenario_paths_sees_new_files(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Ensure a molecule file added to an existing scenario directory is found.
+
+    Args:
+        monkeypatch: pytest monkeypatch fixture.
+        tmp_path: pytest tmp_path fixture.
+    """
+    (tmp_path / "molecule" / "a").mkdir(parents=True)
+    monkeypatch.chdir(tmp_path)
+    assert base._glob_scenario_paths(base.MOLECULE_GLOB) == []
+
+    (tmp_path / "molecule" / "a" / "molecule.yml").touch()
+
+    assert base._glob_scenario_paths(base.MOLECULE_GLOB) == ["molecule/a/molecule.yml"]
+
+
+def test_filter_ignored_scenarios_outside_git(
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Ensure git is not run when the working directory is not in a git work tree.
+
+    Args:
+        mocker: pytest mocker fixture.
+        monkeypatch: pytest monkeypatch fixture.
+        tmp_path: pytest tmp_path fixture.
+    """
+    monkeypatch.chdir(tmp_path)
+    mocker.patch("molecule.command.base._in_git_work_tree", return_value=False)
+    patched_run = mocker.patch("subprocess.run")
+    scenario_paths = ["molecule/a/molecule.yml", "molecule/b/molecule.yml"]
+
+    assert base.filter_ignored_scenarios(scenario_paths) == scenario_paths
+    assert not patched_run.called
+
+
 def test_verify_configs(config_instance: config.Config) -> None:
     """Ensure verify_configs runs normally and does not raise.
 
@@ -502,11 +809,55 @@ def test_verify_configs_raises_with_duplicate_configs(
     assert msg in caplog.text
 
 
+def test_lazy_group_get_command() -> None:
+    """Ensure LazyGroup imports subcommands only when they are requested."""
+    group = base.LazyGroup(lazy_subcommands={"list": "molecule.command.list.list_"})
+    ctx = click.Context(group)
+
+    assert group.list_commands(ctx) == ["list"]
+    assert not group.commands
+
+    command = group.get_command(ctx, "list")
+    assert isinstance(command, click.Command)
+    assert group.commands == {"list": command}
+    assert group.get_command(ctx, "missing") is None
+
+
+def test_command_init_attribute() -> None:
+    """Ensure molecule.command.init stays the init command module once its package is loaded."""
+    import molecule.command  # noqa: PLC0415
+
+    from molecule.command.init import init  # noqa: PLC0415
+
+    assert molecule.command.init is init
+    assert init.__name__ == "molecule.command.init.init"
+
+
+def test_driver_choice() -> None:
+    """Ensure DriverChoice accepts installed drivers and rejects others."""
+    driver_choice = base.DriverChoice()
+
+    assert driver_choice.convert("default", None, None) == "default"
+    with pytest.raises(click.BadParameter):
+        driver_choice.convert("nonexistent", None, None)
+
+
 def test_get_subcommand() -> None:
     """Ensure get_subcommand returns the subcommand name."""
     assert base._get_subcommand(__name__) == "test_base"
 
 
+def test_generate_report() -> None:
+    """Ensure the end-of-run report is rendered as YAML."""
+    results: list[ScenariosResults] = [
+        {"name": "default", "results": [{"subcommand": "create", "state": "PASSED"}]},
+    ]
+
+    assert base.generate_report(results) == (
+        "---\n- name: default\n  results:\n    - state: PASSED\n      subcommand: create\n"
+    )
+
+
 @pytest.mark.parametrize(
     "shell",
     [  # noqa: PT007
@@ -228,6 +228,21 @@ def test_execute_playbook(patched_run_command, _instance):  # type: ignore[no-un
     assert result == "patched-run-command-stdout"
 
 
+def test_execute_playbook_outside_warnings_capture(  # type: ignore[no-untyped-def]  # noqa: ANN201, D103
+    patched_run_command,
+    _instance,  # noqa: PT019
+):
+    def _run_command(**_kwargs: object) -> CompletedProcess[str]:
+        # Parallel scenarios must not hold the warnings lock while ansible runs.
+        assert not ansible_playbook._WARNINGS_LOCK.locked()
+        return CompletedProcess(args="foo", returncode=0, stdout="out", stderr="")
+
+    patched_run_command.side_effect = _run_command
+    _instance._ansible_command = "patched-command"
+
+    assert _instance.execute() == "out"
+
+
 def test_ansible_execute_bakes(_inventory_directory, patched_run_command, _instance):  # type: ignore[no-untyped-def]  # noqa: ANN201, PT019, D103
     _instance.execute()
 
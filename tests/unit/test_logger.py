@@ -86,7 +86,7 @@ def test_get_section_loggers(_patched_logger_env):  # type: ignore[no-untyped-de
     expected_section_loggers = _patched_logger_env
     get_section_loggers.cache_clear()
     section_loggers = get_section_loggers()
-    assert len(section_loggers) == expected_section_loggers  # type: ignore[arg-type]
+    assert len(section_loggers) == expected_section_loggers
 
 
 @pytest.mark.parametrize(
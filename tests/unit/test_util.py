@@ -191,6 +191,27 @@ def test_write_file(test_cache_path: Path) -> None:
     assert x == data
 
 
+def test_write_file_if_changed(tmp_path: Path) -> None:
+    """Test the `write_file_if_changed` function.
+
+    Args:
+        tmp_path: pytest tmp_path fixture.
+    """
+    dest_file = tmp_path / "test_util_write_file_if_changed.tmp"
+
+    assert util.write_file_if_changed(dest_file, "foo")
+    assert not util.write_file_if_changed(dest_file, "foo")
+    assert util.write_file_if_changed(dest_file, "bar")
+    assert dest_file.read_text() == f"{MOLECULE_HEADER}\n\nbar"
+    assert util.write_file_if_changed(dest_file, "bar", header="# foo")
+    assert dest_file.read_text() == "bar"
+    assert not util.write_file_if_changed(dest_file, "bar", header="# baz")
+
+    dest_file.unlink()
+    assert util.write_file_if_changed(dest_file, "bar")
+    assert dest_file.is_file()
+
+
 def test_molecule_prepender(tmp_path: Path) -> None:  # noqa: D103
     fname = tmp_path / "some.txt"
     fname.write_text("foo bar")